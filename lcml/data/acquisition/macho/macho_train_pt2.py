@@ -6,7 +6,8 @@ import re
 
 import numpy as np
 
-from lcml.utils.context_util import absoluteFilePaths, joinRoot
+from lcml.utils.context_util import cachedFilePaths, joinRoot
+from lcml.utils.multiprocess import reportingImapUnordered
 
 
 logger = logging.getLogger(__name__)
@@ -38,40 +39,28 @@ def main():
                           "magnitude", "error"]) + "\n"]
     blueBands = []
 
-    # N.B. pt1 generated file names of the form:
-    # 'field=1_tile=33_seqn=10_class=6.csv'
-    pattern = r"""\d+"""
     dataLengths = Counter()
 
     # Heading for missing UID file
     missing = [",".join(("field", "tile", "seqn")) + "\n"]
-    for f in absoluteFilePaths(inDir, ext="csv"):
-        try:
-            data = np.loadtxt(f, skiprows=1, delimiter=",")
-        except ValueError:
-            logger.critical("can't load file: %s", f)
+    paths = cachedFilePaths(inDir, ext="csv")
+    results = {}
+    for path, result in reportingImapUnordered(_parseClassFile, paths):
+        results[path] = result
+
+    # results complete in arbitrary order; write them in path order so output
+    # is reproducible
+    for path in paths:
+        result = results.pop(path)
+        if result is None:
             continue
 
-        fileName = f.split("/")[-1].split(".")[0]
-        field, tile, seqn, classNum = re.findall(pattern, fileName)
-        label = MACHO_NUM_TO_LABEL[classNum]
-        prefix = [field, tile, seqn]
-        for r in data:
-            # column format for source file
-            # 0=dateobs, 1=rmag, 2=rerr, 3=bmag, 4=berr
-
-            # uid, class label, dateobs, rmag, rerr
-            _rVals = [machoUid(prefix + ["R"]), label] + [str(_) for _ in r[:3]]
-
-            # uid, class label, dateobs, bmag, berr
-            _bVals = ([machoUid(prefix + ["B"]), label] + [str(r[0])] +
-                      [str(_) for _ in r[3:]])
-            redBands.append(",".join(_rVals) + "\n")
-            blueBands.append(",".join(_bVals) + "\n")
-
-        dataLengths[len(data) // 10] += 1  # data length histogram in 10s
-        if not len(data):
-            missing.append(",".join((field, tile, seqn)) + "\n")
+        redLines, blueLines, missingLine, dataLength = result
+        redBands.extend(redLines)
+        blueBands.extend(blueLines)
+        dataLengths[dataLength // 10] += 1  # data length histogram in 10s
+        if missingLine:
+            missing.append(missingLine)
 
     outDir = joinRoot("data/macho")
     trainFile = os.path.join(outDir, "macho-train.csv")
@@ -87,6 +76,45 @@ def main():
                     sorted(list(dataLengths.items())))
 
 
+def _parseClassFile(f: str):
+    """Parses a single class file generated by pt1 into red and blue band csv
+    lines. Parsing is independent per file so this runs in a process pool.
+
+    :returns file path and a tuple of red band lines, blue band lines, missing
+    line (or None), and data length; or None if file cannot be loaded
+    """
+    try:
+        # always 2-D so single row files iterate by row
+        data = np.loadtxt(f, skiprows=1, delimiter=",", ndmin=2)
+    except ValueError:
+        logger.critical("can't load file: %s", f)
+        return f, None
+
+    # N.B. pt1 generated file names of the form:
+    # 'field=1_tile=33_seqn=10_class=6.csv'
+    fileName = f.split("/")[-1].split(".")[0]
+    field, tile, seqn, classNum = re.findall(r"""\d+""", fileName)
+    label = MACHO_NUM_TO_LABEL[classNum]
+    prefix = [field, tile, seqn]
+    redLines = []
+    blueLines = []
+    for r in data:
+        # column format for source file
+        # 0=dateobs, 1=rmag, 2=rerr, 3=bmag, 4=berr
+
+        # uid, class label, dateobs, rmag, rerr
+        _rVals = [machoUid(prefix + ["R"]), label] + [str(_) for _ in r[:3]]
+
+        # uid, class label, dateobs, bmag, berr
+        _bVals = ([machoUid(prefix + ["B"]), label] + [str(r[0])] +
+                  [str(_) for _ in r[3:]])
+        redLines.append(",".join(_rVals) + "\n")
+        blueLines.append(",".join(_bVals) + "\n")
+
+    missingLine = None if len(data) else ",".join((field, tile, seqn)) + "\n"
+    return f, (redLines, blueLines, missingLine, len(data))
+
+
 def machoUid(*args):
     return "-".join(*args)
 
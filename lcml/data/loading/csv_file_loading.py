@@ -1,10 +1,11 @@
 """These functions are duck-typed for input: dataDir: str, limit: int and
 outputs: labels: List[str], times: List[ndarray], magnitudes: List[ndarray],
 errors: List[ndarray]"""
-from abc import abstractmethod
-import csv
 import logging
 
+import numpy as np
+import pandas as pd
+
 from lcml.pipeline.database.sqlite_db import (INSERT_REPLACE_INTO_LCS,
                                               connFromParams,
                                               reportTableCount)
@@ -15,54 +16,39 @@ from lcml.utils.context_util import joinRoot
 logger = logging.getLogger(__name__)
 
 
+#: Number of csv rows parsed into memory at a time
+_READ_CHUNK_SIZE = 100000
+
+
 class LcDataAdapter:
     """An interface / contract to allow a generic method to load a variety
     of CSV light curve datasets having disparate columnar format. All files must
     respect a 'flat' representation where 1) each row is a single timeseries
     data point, 2) individual lightcurves are concatenated together, each in
-    their temporal order 3) all rows contain light curve UID information """
-    def __init__(self):
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def rowEquals(row, uid: str) -> True:
-        """Returns True if row equals uid"""
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def initLcFrom(row) -> (str, str, list, list, list):
-        """Initialize a new light curve object.
-        Returns: uid, label, times, mags, errors
-        """
-        pass
-
-    @staticmethod
-    @abstractmethod
-    def appendRow(times, mags, errors, row):
-        """Append a single row to an in-progress light curve"""
-        pass
+    their temporal order 3) all rows contain light curve UID information.
 
+    Subclasses specify the 0-based index of each required column."""
+    uidCol = None
+    labelCol = None
+    timeCol = None
+    magCol = None
+    errorCol = None
 
-class Ogle3Adapter(LcDataAdapter):
-    @staticmethod
-    def rowEquals(row, uid):
-        return row[-1] == uid
+    @classmethod
+    def columns(cls) -> list:
+        """Returns indices of uid, label, time, mag, and error columns"""
+        return [cls.uidCol, cls.labelCol, cls.timeCol, cls.magCol,
+                cls.errorCol]
 
-    @staticmethod
-    def initLcFrom(row):
-        """Expects OGLE3 source data file to have the following columns:
-         0=HJD, 1=MAG, 2=ERR, 3=FIELD, 4=LABEL, 5=NUM, 6=BAND, 7=ID"""
-        return row[-1], row[4], [row[0]], [row[1]], [row[2]]
 
-    @staticmethod
-    def appendRow(times, mags, errors, row):
-        """Expects OGLE3 source data file to have the following columns:
-         0=HJD, 1=MAG, 2=ERR"""
-        times.append(row[0])
-        mags.append(row[1])
-        errors.append(row[2])
+class Ogle3Adapter(LcDataAdapter):
+    """Expects OGLE3 source data file to have the following columns:
+     0=HJD, 1=MAG, 2=ERR, 3=FIELD, 4=LABEL, 5=NUM, 6=BAND, 7=ID"""
+    uidCol = 7
+    labelCol = 4
+    timeCol = 0
+    magCol = 1
+    errorCol = 2
 
 
 class MachoAdapter(LcDataAdapter):
@@ -73,19 +59,11 @@ class MachoAdapter(LcDataAdapter):
     3 - magnitude
     4 - error
     """
-    @staticmethod
-    def rowEquals(row, uid):
-        return row[0] == uid
-
-    @staticmethod
-    def initLcFrom(row):
-        return row[0], row[1], [row[2]], [row[3]], [row[4]]
-
-    @staticmethod
-    def appendRow(times, mags, errors, row):
-        times.append(row[2])
-        mags.append(row[3])
-        errors.append(row[4])
+    uidCol = 0
+    labelCol = 1
+    timeCol = 2
+    magCol = 3
+    errorCol = 4
 
 
 class K2Adapter(LcDataAdapter):
@@ -115,23 +93,10 @@ class K2Adapter(LcDataAdapter):
     # only select data where SAP quality flags are 0
     goodRows = np.where(data[:, 9] == 0)[0]
     """
-    @staticmethod
-    def rowEquals(row, uid):
-        # Incomplete
-        pass
-
-    @staticmethod
-    def initLcFrom(row):
-        # Incomplete
-        pass
-        # times = data[goodRows, 0]
-        # magnitudes = data[goodRows, 7]
-        # errors = data[goodRows, 8]
-
-    @staticmethod
-    def appendRow(times, mags, errors, row):
-        # Incomplete
-        pass
+    # Incomplete, uid and label columns unknown
+    timeCol = 0
+    magCol = 7
+    errorCol = 8
 
 
 def loadFlatLcDataset(params: dict, dbParams: dict, table: str, limit: float):
@@ -153,42 +118,72 @@ def loadFlatLcDataset(params: dict, dbParams: dict, table: str, limit: float):
     else:
         raise ValueError("Unsupported dataName: %s" % dataName)
 
+    if None in adapter.columns():
+        raise ValueError("Incomplete LC adapter: %s" % dataName)
+
     conn = connFromParams(dbParams)
 
     cursor = conn.cursor()
     reportTableCount(cursor, table, msg="before loading")
     insertOrReplaceQuery = INSERT_REPLACE_INTO_LCS % table
-    with open(dataPath, "r") as f:
-        reader = csv.reader(f, delimiter=",")
-        for _ in range(skiprows):
-            next(reader)
-
-        completedLcs = 0
-        uid = label = times = mags = errors = None
-        for row in reader:
-            if adapter.rowEquals(row, uid):
-                # continue building current LC
-                adapter.appendRow(times, mags, errors, row)
-            else:
-                if uid is not None:
-                    # finish current LC, except for first time
-                    args = (uid, label) + serLc(times, mags, errors)
-                    cursor.execute(insertOrReplaceQuery, args)
-                    completedLcs += 1
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug("completed lc with len: %s", len(times))
-
-                    if not completedLcs % commitFrequency:
-                        logger.info("committing progress: %s", completedLcs)
-                        conn.commit()
-
-                    if completedLcs >= limit:
-                        break
-
-                # initialize new LC
-                uid, label, times, mags, errors = adapter.initLcFrom(row)
+    dtypes = {adapter.uidCol: str, adapter.labelCol: str,
+              adapter.timeCol: np.float64, adapter.magCol: np.float64,
+              adapter.errorCol: np.float64}
+    chunks = pd.read_csv(dataPath, sep=",", header=None, skiprows=skiprows,
+                         usecols=adapter.columns(), dtype=dtypes, engine="c",
+                         chunksize=_READ_CHUNK_SIZE)
+    completedLcs = 0
+    for uid, label, times, mags, errors in _flatLcItr(chunks, adapter):
+        args = (uid, label) + serLc(times, mags, errors)
+        cursor.execute(insertOrReplaceQuery, args)
+        completedLcs += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("completed lc with len: %s", len(times))
+
+        if not completedLcs % commitFrequency:
+            logger.info("committing progress: %s", completedLcs)
+            conn.commit()
+
+        if completedLcs >= limit:
+            break
 
     logger.info("committing progress: %s", completedLcs)
     conn.commit()
     reportTableCount(cursor, table, msg="after loading")
     conn.close()
+
+
+def _flatLcItr(chunks, adapter: LcDataAdapter):
+    """Yields tuples of (uid, label, times, mags, errors) for each run of
+    consecutive rows sharing a uid. The samples of each chunk are copied once
+    into a contiguous (3, n) float64 block and light curves are views of that
+    block between uid-change offsets. The last light curve of a chunk may
+    continue in the next chunk so its rows are carried over."""
+    carry = None
+    for chunk in chunks:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+
+        uids, labels, block, offsets = _chunkBlock(chunk, adapter)
+        for start, end in zip(offsets[:-2], offsets[1:-1]):
+            yield (uids[start], labels[start], block[0, start:end],
+                   block[1, start:end], block[2, start:end])
+
+        carry = chunk.iloc[offsets[-2]:]
+
+    if carry is not None and len(carry):
+        uids, labels, block, _ = _chunkBlock(carry, adapter)
+        yield uids[0], labels[0], block[0], block[1], block[2]
+
+
+def _chunkBlock(chunk: pd.DataFrame, adapter: LcDataAdapter):
+    """Returns uid and label arrays, a contiguous (3, n) block of times, mags,
+    and errors, and the offsets delimiting light curves in the chunk such that
+    light curve `i` spans `offsets[i]:offsets[i + 1]`"""
+    uids = chunk[adapter.uidCol].to_numpy()
+    labels = chunk[adapter.labelCol].to_numpy()
+    dataCols = [adapter.timeCol, adapter.magCol, adapter.errorCol]
+    block = np.ascontiguousarray(chunk[dataCols].to_numpy(dtype=np.float64).T)
+    offsets = np.concatenate(([0], np.flatnonzero(uids[1:] != uids[:-1]) + 1,
+                              [len(uids)]))
+    return uids, labels, block, offsets
@@ -15,12 +15,13 @@ def serLc(times, mags, errors) -> (bytes, bytes, bytes):
 
 
 def serArray(a: Union[np.ndarray, list]) -> bytes:
-    return pickle.dumps(a)
+    """Serializes array to the raw bytes of its float64 values"""
+    return np.ascontiguousarray(a, dtype=np.float64).tobytes()
 
 
 def deserLc(times: bytes, mags: bytes, errors: bytes) -> (
         np.ndarray, np.ndarray, np.ndarray):
-    """Deserializes bytes light curves to numpy arrays of float64
+    """Deserializes bytes light curves to contiguous numpy arrays of float64
     (equivalent of Python float)."""
     t = deserArray(times)
     m = deserArray(mags)
@@ -29,5 +30,29 @@ def deserLc(times: bytes, mags: bytes, errors: bytes) -> (
 
 
 def deserArray(bytesObj: bytes) -> np.ndarray:
-    bytesArray = pickle.loads(bytesObj, encoding="bytes")
-    return np.array(bytesArray, dtype=np.float64)
+    """Deserializes raw float64 bytes without copying. N.B. the returned array
+    is a read-only view of `bytesObj`
+
+    :raises ValueError if `bytesObj` is an array pickled by an older version
+    """
+    if _isPickle(bytesObj):
+        raise ValueError("Found pickled array, the db serialization format is "
+                         "now raw float64 bytes. Please reload the db.")
+
+    return np.frombuffer(bytesObj, dtype=np.float64)
+
+
+def _isPickle(bytesObj: bytes) -> bool:
+    """Returns True if bytes are a pickle, i.e., start with the protocol 2+
+    header, end with the STOP opcode, and unpickle. The header alone can occur
+    in raw float64 data."""
+    if not (bytesObj[:1] == b"\x80" and bytesObj[1:2] in
+            (b"\x02", b"\x03", b"\x04", b"\x05") and bytesObj[-1:] == b"."):
+        return False
+
+    try:
+        pickle.loads(bytesObj, encoding="bytes")
+    except Exception:
+        return False
+
+    return True
@@ -57,7 +57,8 @@ def main():
         return
 
     conn.close()
-    times, mag, err = deserLc(*row[2:])
+    # writable copies of deserLc's read-only views for feets
+    times, mag, err = (a.copy() for a in deserLc(*row[2:]))
 
     times = times[START_SLICE:END_SLICE]
     mag = mag[START_SLICE:END_SLICE]
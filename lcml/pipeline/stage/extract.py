@@ -8,21 +8,21 @@ from lcml.pipeline.database.serialization import deserLc, serArray
 from lcml.pipeline.database.sqlite_db import (INSERT_REPLACE_INTO_FEATURES,
                                               SINGLE_COL_PAGED_SELECT_QRY,
                                               connFromParams,
-                                              reportTableCount)
-from lcml.utils.multiprocess import feetsExtract, reportingImapUnordered
+                                              reportTableCount, tableCount)
+from lcml.utils.multiprocess import (feetsExtract, initFeatureSpace,
+                                     jobChunksize, physicalCpuCount,
+                                     reportingImapUnordered)
 
 
 logger = logging.getLogger(__name__)
 
 
-def feetsJobGenerator(fs: FeatureSpace, dbParams: dict, tableName: str,
-                      selRows: str="*", offset: int=0):
+def feetsJobGenerator(dbParams: dict, tableName: str, selRows: str="*",
+                      offset: int=0):
     """Returns a generator of tuples of the form:
-    (featureSpace (feets.FeatureSpace),  id (str), label (str), times (ndarray),
-     mags (ndarray), errors(ndarray))
+    (id (str), label (str), times (ndarray), mags (ndarray), errors(ndarray))
     Each tuple is used to perform a 'feets' feature extraction job.
 
-    :param fs: feets.FeatureSpace object required to perform extraction
     :param dbParams: additional params
     :param tableName: table containing light curves
     :param selRows: which rows to select from clean LC table
@@ -42,9 +42,11 @@ def feetsJobGenerator(fs: FeatureSpace, dbParams: dict, tableName: str,
         cursor.execute(q)
         rows = cursor.fetchall()
         for r in rows:
-            times, mags, errors = deserLc(*r[2:])
+            # copy since deserLc returns read-only views and feets extractors
+            # aren't guaranteed to leave their input unmodified
+            times, mags, errors = (a.copy() for a in deserLc(*r[2:]))
             # intended args for lcml.utils.multiprocess._feetsExtract
-            yield (fs, r[0], r[1], times, mags, errors)
+            yield (r[0], r[1], times, mags, errors)
 
         if rows:
             previousId = rows[-1][0]
@@ -73,8 +75,8 @@ def feetsExtractFeatures(extractParams: dict, dbParams: dict, lcTable: str,
     """
     # recommended excludes (slow): "CAR_mean", "CAR_sigma", "CAR_tau"
     # also produces nan's: "ls_fap"
-    logger.info("Excluded features: %s", extractParams["excludedFeatures"])
-    fs = getFeatureSpace(extractParams)
+    excludedFeatures = extractParams["excludedFeatures"]
+    logger.info("Excluded features: %s", excludedFeatures)
 
     ciFreq = dbParams["commitFrequency"]
     conn = connFromParams(dbParams)
@@ -85,11 +87,16 @@ def feetsExtractFeatures(extractParams: dict, dbParams: dict, lcTable: str,
     offset = extractParams.get("offset", 0)
     logger.info("Beginning extraction at offset: %s in LC table", offset)
 
-    jobs = feetsJobGenerator(fs, dbParams, lcTable, offset=offset)
+    # jobs are streamed from the db so size chunks using the table count
+    jobCount = min(max(tableCount(cursor, lcTable) - offset, 0), limit)
+    chunksize = jobChunksize(int(jobCount), physicalCpuCount())
+    jobs = feetsJobGenerator(dbParams, lcTable, offset=offset)
     lcCount = 0
     dbExceptions = 0
-    for uid, label, ftNames, features in reportingImapUnordered(feetsExtract,
-                                                                jobs):
+    for uid, label, ftNames, features in reportingImapUnordered(
+            feetsExtract, jobs, chunksize=chunksize,
+            initializer=initFeatureSpace,
+            initargs=(STANDARD_INPUT_DATA_TYPES, excludedFeatures)):
         # loop variables come from lcml.utils.multiprocess._feetsExtract
         args = (uid, label, serArray(features))
         try:
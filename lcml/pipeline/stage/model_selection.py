@@ -123,8 +123,12 @@ def randomForestGridSearch(params) -> Generator[dict, None, None]:
             for f in featuresAxis for t in treesAxis)
 
 
+#: N.B. for single-label multiclass data micro-averaged F1 equals accuracy so
+#: it's not scored separately
+_SCORING_TYPES = ["accuracy", "f1_macro", "f1_weighted"]
+
+
 # DEPRECATED
-_SCORING_TYPES = ["accuracy", "f1_micro", "f1_macro", "f1_weighted"]
 def selectBestModel(modelClass, hyperparamsItr, X, y, folds, repeats,
                     selectionMetricName="test_f1_weighted"):
     """Peforms k-fold cross validation on all specified models and selects model
@@ -144,6 +148,12 @@ def selectBestModel(modelClass, hyperparamsItr, X, y, folds, repeats,
     """
     start = time.time()
     cv = RepeatedStratifiedKFold(n_splits=folds, n_repeats=repeats)
+
+    # split once so every model is evaluated on identical folds
+    cvSplits = list(cv.split(X, y))
+    if selectionMetricName == "test_f1_micro":
+        selectionMetricName = "test_accuracy"
+
     bestHyperparams = None
     allResults = []
     maxScore = 0
@@ -154,12 +164,12 @@ def selectBestModel(modelClass, hyperparamsItr, X, y, folds, repeats,
     for modelCount, kwargs in enumerate(hyperparamsItr):
         cvStart = time.time()
         model = modelClass(**kwargs)
-        scores = cross_validate(model, X, y, scoring=_SCORING_TYPES, cv=cv,
-                                n_jobs=-1)
+        scores = cross_validate(model, X, y, scoring=_SCORING_TYPES,
+                                cv=cvSplits, n_jobs=-1)
 
         # average metrics across folds
         accuracy = np.average(scores["test_accuracy"])
-        f1Micro = np.average(scores["test_f1_micro"])
+        f1Micro = accuracy
         f1Macro = np.average(scores["test_f1_macro"])
         f1Weight = np.average(scores["test_f1_weighted"])
         mets = ClassificationMetrics(accuracy, f1Micro, f1Macro, f1Weight, None)
@@ -1,15 +1,17 @@
+from collections import namedtuple
 import logging
-import numpy as np
 
-from feets import preprocess
-from sklearn.preprocessing import StandardScaler
+import numpy as np
 
 from lcml.pipeline.database.sqlite_db import (INSERT_REPLACE_INTO_LCS,
                                               connFromParams,
                                               reportTableCount,
+                                              setBulkInsertPragmas,
                                               singleColPagingItr, tableCount)
 from lcml.pipeline.database.serialization import deserLc, serLc
 from lcml.utils.format_util import fmtPct
+from lcml.utils.numba_utils import (allFiniteFloat, NUMBA_AVAILABLE,
+                                    NUMBA_FLOAT_DTYPES)
 
 
 logger = logging.getLogger(__name__)
@@ -41,31 +43,66 @@ SUFFICIENT_LC_DATA = 80
 NON_FINITE_VALUES = {np.nan, float("nan"), float("inf"), float("-inf")}
 
 
-def preprocessLc(timeData, magData, errorData, removes, stdLimit, errorLimit):
+#: Values to scrub split for vectorized matching: `nonFinite` (bool) whether
+#: nan and inf are removed and `sentinels` (ndarray) finite values removed
+BogusValues = namedtuple("BogusValues", ["nonFinite", "sentinels"])
+
+
+def bogusValues(removes) -> BogusValues:
+    """Splits a collection of values to scrub into a `BogusValues`"""
+    nonFinite = any(not np.isfinite(r) for r in removes)
+    sentinels = np.fromiter((r for r in removes if np.isfinite(r)),
+                            dtype=np.float64)
+    return BogusValues(nonFinite, sentinels)
+
+
+def preprocessLc(timeData, magData, errorData, bogus: BogusValues, stdLimit,
+                 errorLimit, standardize: bool=False):
     """Returns a cleaned version of an LC. LC may be deemed unfit for use, in
     which case the reason for rejection is specified.
 
+    Bogus values and statistical outliers are removed with a single combined
+    mask. The outlier criterion mirrors `feets.preprocess.remove_noise`. If
+    `standardize`, magnitudes and errors of the kept data are then scaled to
+    zero mean and unit variance in-place.
+
+    N.B. time, mag, and error data must already be float64 ndarrays, e.g., as
+    returned by `deserLc`, so no conversion happens per LC.
+
     :returns processed lc as a tuple and failure reason (string)
     """
     removedCounts = {DATA_BOGUS_REMOVED: 0, DATA_OUTLIER_REMOVED: 0}
     if len(timeData) < SUFFICIENT_LC_DATA:
         return None, INSUFFICIENT_DATA_REASON, removedCounts
 
-    # remove bogus data
-    tm, mag, err = lcFilterBogus(timeData, magData, errorData, removes=removes)
-    removedCounts[DATA_BOGUS_REMOVED] = len(timeData) - len(tm)
-    if len(tm) < SUFFICIENT_LC_DATA:
+    # bogus data
+    valid = _bogusMask(magData, errorData, bogus)
+    validCount = int(valid.sum())
+    removedCounts[DATA_BOGUS_REMOVED] = len(timeData) - validCount
+    if validCount < SUFFICIENT_LC_DATA:
         return None, BOGUS_DATA_REASON, removedCounts
 
-    # removes statistical outliers
-    _tm, _mag, _err = preprocess.remove_noise(tm, mag, err,
-                                              error_limit=errorLimit,
-                                              std_limit=stdLimit)
-    removedCounts[DATA_OUTLIER_REMOVED] = len(tm) - len(_tm)
-    if len(_tm) < SUFFICIENT_LC_DATA:
+    # statistical outliers, stats computed on valid data only
+    validMag = magData[valid]
+    errorTolerance = errorLimit * (errorData[valid].mean() or 1)
+    magMean = validMag.mean()
+    magStd = validMag.std()
+    with np.errstate(invalid="ignore"):
+        keep = (valid & (errorData < errorTolerance) &
+                (np.abs(magData - magMean) < stdLimit * magStd))
+
+    keepCount = int(keep.sum())
+    removedCounts[DATA_OUTLIER_REMOVED] = validCount - keepCount
+    if keepCount < SUFFICIENT_LC_DATA:
         return None, OUTLIERS_REASON, removedCounts
 
-    return [_tm, _mag, _err], None, removedCounts
+    keptMag = magData[keep]
+    keptErr = errorData[keep]
+    if standardize:
+        _standardizeArray(keptMag)
+        _standardizeArray(keptErr)
+
+    return [timeData[keep], keptMag, keptErr], None, removedCounts
 
 
 #: Default value for preprocessing param `std threshold`
@@ -75,22 +112,27 @@ DEFAULT_STD_LIMIT = 5
 DEFAULT_ERROR_LIMIT = 3
 
 
-def _standardizeArray(scaler: StandardScaler, a: np.ndarray) -> np.ndarray:
-    _reshaped = a.reshape(-1, 1)
-    _transformed = scaler.fit_transform(_reshaped)
-    return _transformed.reshape(-1)
+def _standardizeArray(a: np.ndarray):
+    """Zero mean, unit variance scaling in-place. Equivalent to
+    `StandardScaler().fit_transform` for 1-D data, including leaving the scale
+    unchanged for constant data."""
+    a -= a.mean()
+    std = a.std()
+    if std:
+        a /= std
 
 
 def cleanLightCurves(params: dict, dbParams: dict, rawTable: str,
                      cleanTable: str, limit: float):
     """Clean lightcurves and report details on discards."""
     removes = set(params["filter"]) if "filter" in params else set()
-    removes = removes.union(NON_FINITE_VALUES)
+    bogus = bogusValues(removes.union(NON_FINITE_VALUES))
     stdLimit = params.get("stdLimit", DEFAULT_STD_LIMIT)
     errorLimit = params.get("errorLimit", DEFAULT_ERROR_LIMIT)
     commitFrequency = dbParams["commitFrequency"]
     conn = connFromParams(dbParams)
     cursor = conn.cursor()
+    setBulkInsertPragmas(cursor)
     reportTableCount(cursor, cleanTable, msg="before cleaning")
     insertOrReplace = INSERT_REPLACE_INTO_LCS % cleanTable
     totalLcs = tableCount(cursor, rawTable)
@@ -101,25 +143,23 @@ def cleanLightCurves(params: dict, dbParams: dict, rawTable: str,
     bogusIssueCount = 0
     outlierIssueCount = 0
     insertCount = 0
-    scaler = StandardScaler(copy=False)
     standardize = params.get("standardize", False)
+    pending = []
     itr = singleColPagingItr(cursor, rawTable, columnName="id", columnIndex=0,
                              columnEscaped=True)
     for i, r in enumerate(itr):
         times, mags, errors = deserLc(*r[2:])
-        lc, issue, _ = preprocessLc(times, mags, errors, removes=removes,
-                                    stdLimit=stdLimit, errorLimit=errorLimit)
+        lc, issue, _ = preprocessLc(times, mags, errors, bogus=bogus,
+                                    stdLimit=stdLimit, errorLimit=errorLimit,
+                                    standardize=standardize)
         if lc:
-            if standardize:
-                lc[1] = _standardizeArray(scaler, lc[1])
-                lc[2] = _standardizeArray(scaler, lc[2])
-
-            args = (r[0], r[1]) + serLc(*lc)
-            cursor.execute(insertOrReplace, args)
+            pending.append((r[0], r[1]) + serLc(*lc))
             insertCount += 1
-            if insertCount % commitFrequency == 0:
+            if len(pending) == commitFrequency:
                 logger.info("progress: %s", insertCount)
+                cursor.executemany(insertOrReplace, pending)
                 conn.commit()
+                pending.clear()
 
         elif issue == INSUFFICIENT_DATA_REASON:
             shortIssueCount += 1
@@ -133,6 +173,9 @@ def cleanLightCurves(params: dict, dbParams: dict, rawTable: str,
         if i >= limit:
             break
 
+    if pending:
+        cursor.executemany(insertOrReplace, pending)
+
     reportTableCount(cursor, cleanTable, msg="after cleaning")
     conn.commit()
     conn.close()
@@ -148,19 +191,56 @@ def cleanLightCurves(params: dict, dbParams: dict, rawTable: str,
 
 def lcFilterBogus(mjds, values, errors, removes):
     """Simple light curve filter that removes bogus magnitude and error
-    values."""
-    return zip(*[(mjds[i], v, errors[i])
-                 for i, v in enumerate(values)
-                 if v not in removes and errors[i] not in removes])
+    values.
+
+    :returns filtered times, values, and errors as float64 ndarrays
+    """
+    mjds = np.asarray(mjds, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    errors = np.asarray(errors, dtype=np.float64)
+    mask = _bogusMask(values, errors, bogusValues(removes))
+    return mjds[mask], values[mask], errors[mask]
+
+
+def _bogusMask(values: np.ndarray, errors: np.ndarray,
+               bogus: BogusValues) -> np.ndarray:
+    """Boolean mask of samples whose value and error are not bogus. Non-finite
+    values are matched with `np.isfinite` since nan never compares equal."""
+    if bogus.nonFinite:
+        mask = np.isfinite(values) & np.isfinite(errors)
+    else:
+        mask = np.ones(len(values), dtype=bool)
+
+    if bogus.sentinels.size:
+        mask &= (~np.isin(values, bogus.sentinels) &
+                 ~np.isin(errors, bogus.sentinels))
+
+    return mask
+
+
+#: Number of values checked at a time by `allFinite` without numba
+_FINITE_SCAN_BLOCK = 4096
 
 
 def allFinite(X):
     """Adapted from sklearn.utils.validation._assert_all_finite"""
     X = np.asanyarray(X)
-    # First try an O(n) time, O(1) space solution for the common case that
-    # everything is finite; fall back to O(n) space np.isfinite to prevent
-    # false positives from overflow in sum method.
-    return (False
-            if X.dtype.char in np.typecodes['AllFloat'] and
-               not np.isfinite(X.sum()) and not np.isfinite(X).all()
-            else True)
+    if X.dtype.char not in np.typecodes['AllFloat']:
+        return True
+
+    if NUMBA_AVAILABLE and X.dtype in NUMBA_FLOAT_DTYPES:
+        # short-circuits on first non-finite value without a bool temporary
+        return allFiniteFloat(X)
+
+    # Single pass over fixed-size blocks reusing a small scratch mask; returns
+    # at the first block containing a non-finite value
+    flat = X.ravel()
+    buf = np.empty(min(flat.size, _FINITE_SCAN_BLOCK), dtype=bool)
+    for start in range(0, flat.size, _FINITE_SCAN_BLOCK):
+        block = flat[start:start + _FINITE_SCAN_BLOCK]
+        mask = buf[:block.size]
+        np.isfinite(block, out=mask)
+        if not mask.all():
+            return False
+
+    return True
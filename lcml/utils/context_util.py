@@ -1,7 +1,12 @@
 import json
+import logging
 import os
+import pickle
 
-from typing import Generator
+from typing import Generator, List
+
+
+logger = logging.getLogger(__name__)
 
 
 _ROOT_ENV_VAR = "LCML"
@@ -45,3 +50,48 @@ def absoluteFilePaths(dirPath: str,
 
             if c == limit:
                 break
+
+
+#: Name of file caching a directory's file paths, see `cachedFilePaths`
+_FILE_INDEX_NAME = ".file_index.pkl"
+
+
+def cachedFilePaths(dirPath: str, ext: str=None) -> List[str]:
+    """Returns the sorted list of `absoluteFilePaths(dirPath, ext)` cached in
+    a pickled index file in `dirPath`. The index is rebuilt when the
+    directory's mtime advances, i.e., when files are added, removed or renamed
+    directly in `dirPath`. N.B. changes inside subdirectories are not
+    detected."""
+    indexPath = os.path.join(dirPath, _FILE_INDEX_NAME)
+    try:
+        with open(indexPath, "rb") as f:
+            index = pickle.load(f)
+        if (index["mtime"] == os.stat(dirPath).st_mtime_ns and
+                index["ext"] == ext):
+            return index["paths"]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        pass
+
+    try:
+        # create the index before reading the mtime since creation updates it;
+        # files added after the mtime is read invalidate the cache next time
+        with open(indexPath, "ab"):
+            pass
+        mtime = os.stat(dirPath).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    paths = sorted(p for p in absoluteFilePaths(dirPath, ext=ext)
+                   if p != indexPath)
+    if mtime is None:
+        logger.warning("Cannot write file index to: %s", dirPath)
+        return paths
+
+    try:
+        # overwriting the existing index file leaves the dir's mtime unchanged
+        with open(indexPath, "wb") as f:
+            pickle.dump({"mtime": mtime, "ext": ext, "paths": paths}, f)
+    except OSError:
+        logger.warning("Cannot write file index to: %s", dirPath)
+
+    return paths
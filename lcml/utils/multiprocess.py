@@ -2,44 +2,87 @@ import logging
 from multiprocessing import cpu_count, Pool
 from typing import Iterable
 
+from feets import FeatureSpace
+import psutil
+
 
 logger = logging.getLogger(__name__)
 
 
+#: Per-process feets.FeatureSpace, set by `initFeatureSpace` in each worker
+_FEATURE_SPACE = None
+
+
+def physicalCpuCount() -> int:
+    """Number of physical cores. Falls back to logical cores if the physical
+    count cannot be determined."""
+    return psutil.cpu_count(logical=False) or cpu_count()
+
+
+def jobChunksize(jobCount: int, workers: int) -> int:
+    """Chunksize amortizing IPC overhead while still giving each worker several
+    chunks to balance load"""
+    return max(1, jobCount // (4 * workers))
+
+
 def reportingImapUnordered(func,
                            jobArgs: Iterable[tuple],
-                           reportFrequency: int=100):
+                           reportFrequency: int=100,
+                           chunksize: int=None,
+                           initializer=None,
+                           initargs: tuple=()):
     """Executes a function on a batch of inputs using multiprocessing in an
     unordered fashion (`multiprocessing.Pool.imap_unordered`). Reports progress
-    periodically as jobs complete
+    periodically as jobs complete. Uses one process per physical core.
 
     :param func: function to execute
     :param jobArgs: iterable of tuples where each tuple is the arguments to
     `func` for a single job
     :param reportFrequency: After a batch of jobs having this size completes,
     log simple status report
+    :param chunksize: number of jobs sent to a worker at a time. If not
+    specified, computed from the length of `jobArgs` when it has one,
+    otherwise 1.
+    :param initializer: function called once in each worker process on start
+    :param initargs: arguments to `initializer`
     :return list of job results
     """
-    p = Pool(processes=cpu_count())
+    workers = physicalCpuCount()
+    if chunksize is None:
+        try:
+            chunksize = jobChunksize(len(jobArgs), workers)
+        except TypeError:
+            chunksize = 1
+
     i = -1
-    for i, result in enumerate(p.imap_unordered(func, jobArgs), 1):
-        yield result
-        if i % reportFrequency == 0:
-            logger.info("multiprocessing completed: %s", i)
+    with Pool(processes=workers, initializer=initializer,
+              initargs=initargs) as p:
+        for i, result in enumerate(p.imap_unordered(func, jobArgs,
+                                                    chunksize=chunksize), 1):
+            yield result
+            if i % reportFrequency == 0:
+                logger.info("multiprocessing completed: %s", i)
 
     logger.info("multiprocessing: total completed: %s", i)
 
 
+def initFeatureSpace(data: list, exclude: list):
+    """Pool initializer building the worker's `feets.FeatureSpace` once rather
+    than pickling it with every job"""
+    global _FEATURE_SPACE
+    _FEATURE_SPACE = FeatureSpace(data=data, exclude=exclude)
+
+
 def feetsExtract(args) -> (str, str, list, list):
     """Wrapper function conforming to Python multiprocessing API performing the
-    `feets` library's feature extraction.
+    `feets` library's feature extraction. Requires the pool to be initialized
+    with `initFeatureSpace`.
     """
     return _feetsExtract(*args)
 
 
-def _feetsExtract(featureSpace, uid, label, times, mags, errors):
+def _feetsExtract(uid, label, times, mags, errors):
     """
-    :param featureSpace: feets.FeatureSpace object
     :param uid: light curve uid
     :param label: class label
     :param times: lc times
@@ -48,7 +91,7 @@ def _feetsExtract(featureSpace, uid, label, times, mags, errors):
     :return: lc uid, lc class label, feature names, feature values
     """
     try:
-        ftNames, features = featureSpace.extract(times, mags, errors)
+        ftNames, features = _FEATURE_SPACE.extract(times, mags, errors)
     except BaseException:
         logger.exception("Feets bombed for LC uid: %s", uid)
         raise
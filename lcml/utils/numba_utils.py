@@ -0,0 +1,35 @@
+"""Optional numba-compiled kernels. `numba` is not a hard requirement; callers
+should check `NUMBA_AVAILABLE` and fall back to numpy otherwise."""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+#: dtypes for which `allFiniteFloat` is compiled
+NUMBA_FLOAT_DTYPES = (np.float32, np.float64)
+
+
+def _allFinite(x: np.ndarray) -> bool:
+    """Scans a 1-D float array returning False at the first non-finite value"""
+    for i in range(x.shape[0]):
+        v = x[i]
+        if v != v or v == np.inf or v == -np.inf:
+            return False
+
+    return True
+
+
+if NUMBA_AVAILABLE:
+    _allFinite = njit(fastmath=False, cache=True)(_allFinite)
+
+
+def allFiniteFloat(x: np.ndarray) -> bool:
+    """Returns True if all values of a float32 or float64 array are finite.
+    Scans the array in its native dtype, copying only if it isn't contiguous.
+    Requires numba."""
+    return _allFinite(x.ravel())